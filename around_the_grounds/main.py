@@ -63,15 +63,17 @@ def format_events_output(
         output.append(f"Found {len(events)} food truck events:")
         output.append("")
 
-        current_date = None
+        current_day = None
         for event in events:
-            event_date = event.date.strftime("%A, %B %d, %Y")
-
-            if current_date != event_date:
-                if current_date is not None:
+            # Events arrive sorted by date, so only render the day header
+            # when the day actually changes instead of calling the
+            # locale-aware strftime for every event
+            event_day = event.date.date()
+            if current_day != event_day:
+                if current_day is not None:
                     output.append("")
-                output.append(f"📅 {event_date}")
-                current_date = event_date
+                output.append(f"📅 {event.date.strftime('%A, %B %d, %Y')}")
+                current_day = event_day
 
             time_str = ""
             if event.start_time:
@@ -160,6 +162,14 @@ async def generate_web_data(
     events: List[FoodTruckEvent], error_messages: Optional[List[str]] = None
 ) -> dict:
     """Generate web-friendly JSON data from events with Pacific timezone information."""
+    # Kick off haiku generation immediately; the blocking Claude call runs in
+    # a worker thread (see HaikuGenerator), so its round-trip overlaps with
+    # the event serialization below. The sleep(0) yields once so the task
+    # actually reaches the API call before the synchronous serialization
+    # loop starts.
+    haiku_task = asyncio.create_task(_generate_haiku_for_today(events))
+    await asyncio.sleep(0)
+
     web_events = []
 
     for event in events:
@@ -203,8 +213,9 @@ async def generate_web_data(
 
     unique_error_messages = list(dict.fromkeys(error_messages or []))
 
-    # Generate haiku for today's food trucks
-    haiku = await _generate_haiku_for_today(events)
+    # Join the haiku task started above; _generate_haiku_for_today catches
+    # its own errors and returns None, so this never fails data generation
+    haiku = await haiku_task
 
     return {
         "events": web_events,
@@ -387,10 +398,17 @@ async def preview_locally(
         with open(json_path, "w") as f:
             json.dump(web_data, f, indent=2)
 
-        print(f"✅ Generated local preview: {len(events)} events")
-        print(f"📁 Preview files in: {local_public_dir}")
-        print("🌐 To serve locally: cd public && python -m http.server 8000")
-        print("🔗 Then visit: http://localhost:8000")
+        # One write for the whole success block instead of a flush per line
+        print(
+            "\n".join(
+                [
+                    f"✅ Generated local preview: {len(events)} events",
+                    f"📁 Preview files in: {local_public_dir}",
+                    "🌐 To serve locally: cd public && python -m http.server 8000",
+                    "🔗 Then visit: http://localhost:8000",
+                ]
+            )
+        )
 
         return True
 
@@ -474,8 +492,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         level=log_level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
-    print("🍺 Around the Grounds - Food Truck Tracker")
-    print("=" * 50)
+    print("🍺 Around the Grounds - Food Truck Tracker\n" + "=" * 50)
 
     try:
         return asyncio.run(async_main(args))
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 
@@ -14,6 +15,11 @@ class FoodTruckEvent:
     description: Optional[str] = None
     ai_generated_name: bool = False
 
+    @cached_property
+    def summary_line(self) -> str:
+        """One-line prompt summary, computed once per event."""
+        return f"- {self.food_truck_name} at {self.brewery_name}"
+
     def __str__(self) -> str:
         date_str = self.date.strftime("%Y-%m-%d") if self.date else "None"
         time_str = ""
@@ -284,8 +284,15 @@ class StoupBallardParser(BaseParser):
         return start_time, end_time
 
     def _parse_time_from_text(self, date: datetime, time_str: str) -> tuple:
+        lowered = time_str.lower()
+
+        # Every supported format carries an am/pm suffix, so skip the regex
+        # machinery entirely for text that can't possibly match
+        if "am" not in lowered and "pm" not in lowered:
+            return None, None
+
         # Handle special cases like "noon" and different time formats
-        if "noon" in time_str.lower():
+        if "noon" in lowered:
             # Handle "noon — 4pm" format
             noon_match = re.search(r"noon\s*—\s*(\d{1,2})(am|pm)", time_str)
             if noon_match:
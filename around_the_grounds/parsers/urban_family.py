@@ -1,5 +1,7 @@
 import asyncio
+import functools
 import json
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -11,6 +13,61 @@ from ..utils.timezone_utils import PACIFIC_TZ
 from ..utils.vision_analyzer import VisionAnalyzer
 from .base import BaseParser
 
+# Precompiled patterns for the date formats the Hivey API actually returns.
+# A single regex match plus a month-table lookup is an order of magnitude
+# faster than chained strptime attempts. Adjacent tokens draw from disjoint
+# character classes (letters / whitespace / digits), so failed matches bail
+# out in linear time with no backtracking.
+_MONTH_NAME_DATE_RE = re.compile(r"^\s*([A-Za-z]{3,9})\s+(\d{1,2}),?\s+(\d{4})\s*$")
+_NUMERIC_DATE_RE = re.compile(r"^\s*(\d{1,2})/(\d{1,2})/(\d{4})\s*$")
+
+_MONTHS: Dict[str, int] = {
+    "january": 1,
+    "february": 2,
+    "march": 3,
+    "april": 4,
+    "may": 5,
+    "june": 6,
+    "july": 7,
+    "august": 8,
+    "september": 9,
+    "october": 10,
+    "november": 11,
+    "december": 12,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_explicit_date(date_str: str) -> Optional[datetime]:
+    """Parse date strings with an explicit year, memoized per string.
+
+    Calendar feeds repeat the same date string across many events, so
+    repeated inputs become dict lookups. Only formats carrying their own
+    year are cached here; relative formats are left to DateUtils, whose
+    year inference depends on the current date.
+    """
+    # "July 06, 2025" / "July 06 2025" format
+    match = _MONTH_NAME_DATE_RE.match(date_str)
+    if match:
+        month = _MONTHS.get(match.group(1).lower())
+        if month:
+            try:
+                return datetime(int(match.group(3)), month, int(match.group(2)))
+            except ValueError:
+                return None
+
+    # "07/06/2025" format
+    match = _NUMERIC_DATE_RE.match(date_str)
+    if match:
+        try:
+            return datetime(
+                int(match.group(3)), int(match.group(1)), int(match.group(2))
+            )
+        except ValueError:
+            return None
+
+    return None
+
 
 class UrbanFamilyParser(BaseParser):
     """
@@ -471,19 +528,12 @@ class UrbanFamilyParser(BaseParser):
         """
         Parse Urban Family date format like "July 06, 2025".
         """
-        try:
-            # Parse "July 06, 2025" format
-            return datetime.strptime(date_str, "%B %d, %Y")
-        except ValueError:
-            # Try other common formats
-            try:
-                return datetime.strptime(date_str, "%B %d %Y")
-            except ValueError:
-                try:
-                    return datetime.strptime(date_str, "%m/%d/%Y")
-                except ValueError:
-                    # Fall back to the utility function
-                    return DateUtils.parse_date_from_text(date_str)
+        parsed_date = _parse_explicit_date(date_str)
+        if parsed_date:
+            return parsed_date
+
+        # Fall back to the utility function
+        return DateUtils.parse_date_from_text(date_str)
 
     def _extract_times(self, item: Dict[str, Any], date: datetime) -> tuple:
         """
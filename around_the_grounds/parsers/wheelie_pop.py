@@ -1,9 +1,12 @@
+import asyncio
+import functools
 import re
-from datetime import datetime
+from datetime import date, datetime
 from typing import List, Optional, Set, Tuple
 
 import aiohttp
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
 from bs4.element import Tag
 
 from ..models import FoodTruckEvent
@@ -15,6 +18,19 @@ from ..utils.timezone_utils import (
 from .base import BaseParser
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_selector(selector: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once and reuse it across parse calls."""
+    return soupsieve.compile(selector)
+
+
+# Dedup key for events returned by overlapping month fetches
+EventKey = Tuple[date, Optional[datetime], str]
+
+# Both time nodes are selected in one traversal and classified by ancestor
+_TIME_NODES_SELECTOR = ".event-time time, .end-time time"
+
+
 class WheeliePopParser(BaseParser):
     """Parser for Wheelie Pop Brewing's My Calendar feed."""
 
@@ -23,22 +39,36 @@ class WheeliePopParser(BaseParser):
 
     async def parse(self, session: aiohttp.ClientSession) -> List[FoodTruckEvent]:
         events: List[FoodTruckEvent] = []
-        seen_event_keys: Set[str] = set()
+        seen_event_keys: Set[EventKey] = set()
 
         current = now_in_pacific()
-        for year, month in self._months_to_fetch(current):
-            try:
-                html = await self._fetch_calendar_month(session, year, month)
-            except ValueError as exc:
+        months = self._months_to_fetch(current)
+
+        # The month pages are independent, so fetch them concurrently; the
+        # network round-trips overlap instead of paying one RTT per month.
+        results = await asyncio.gather(
+            *(
+                self._fetch_calendar_month(session, year, month)
+                for year, month in months
+            ),
+            return_exceptions=True,
+        )
+
+        for (year, month), result in zip(months, results):
+            if isinstance(result, ValueError):
                 self.logger.error(
-                    f"Wheelie Pop calendar request failed for {year}-{month:02d}: {exc}"
+                    f"Wheelie Pop calendar request failed for {year}-{month:02d}: {result}"
                 )
                 continue
+            if isinstance(result, BaseException):
+                # Timeouts and other unexpected errors keep their existing
+                # handling in the coordinator's retry logic
+                raise result
 
-            if not html:
+            if not result:
                 continue
 
-            month_events = self._parse_calendar_html(html, seen_event_keys)
+            month_events = self._parse_calendar_html(result, seen_event_keys)
             events.extend(month_events)
 
         valid_events = self.filter_valid_events(events)
@@ -62,7 +92,7 @@ class WheeliePopParser(BaseParser):
 
     async def _fetch_calendar_month(
         self, session: aiohttp.ClientSession, year: int, month: int
-    ) -> Optional[str]:
+    ) -> Optional[bytes]:
         params = {
             "yr": str(year),
             "month": f"{month:02d}",
@@ -99,19 +129,26 @@ class WheeliePopParser(BaseParser):
                 if response.status != 200:
                     raise ValueError(f"HTTP {response.status}")
 
-                text = await response.text()
-                if not text or not text.strip():
+                # Hand the raw bytes to lxml, which sniffs the encoding
+                # itself; decoding to str here would just be a second pass
+                body = await response.read()
+                if not body or not body.strip():
                     raise ValueError("Empty response body")
 
-                return text
+                return body
 
         except aiohttp.ClientError as exc:
             raise ValueError(f"Network error: {exc}")
 
     def _parse_calendar_html(
-        self, html: str, seen_event_keys: Set[str]
+        self, html: bytes, seen_event_keys: Set[EventKey]
     ) -> List[FoodTruckEvent]:
-        soup = BeautifulSoup(html, "html.parser")
+        # Only build a tree for the calendar container; the rest of the page
+        # (theme markup, scripts, nav) is skipped entirely, keeping parse CPU
+        # and peak memory bounded regardless of month size
+        soup = BeautifulSoup(
+            html, "lxml", parse_only=SoupStrainer("div", id=self.CALENDAR_ID)
+        )
 
         container = soup.find("div", id=self.CALENDAR_ID)
         if not container or not isinstance(container, Tag):
@@ -167,8 +204,7 @@ class WheeliePopParser(BaseParser):
             self.logger.debug("Skipping article with no food truck name")
             return None
 
-        start_time = self._parse_time(article, ".event-time time")
-        end_time = self._parse_time(article, ".end-time time")
+        start_time, end_time = self._extract_event_times(article)
 
         return FoodTruckEvent(
             brewery_key=self.brewery.key,
@@ -180,11 +216,40 @@ class WheeliePopParser(BaseParser):
             ai_generated_name=False,
         )
 
-    def _parse_time(self, article: Tag, selector: str) -> Optional[datetime]:
-        time_node = article.select_one(selector)
-        if not time_node or not isinstance(time_node, Tag):
-            return None
+    def _extract_event_times(
+        self, article: Tag
+    ) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Collect start and end times in a single pass over the article."""
+        start_time: Optional[datetime] = None
+        end_time: Optional[datetime] = None
+
+        for time_node in _compile_selector(_TIME_NODES_SELECTOR).select(article):
+            parsed = self._parse_time_node(time_node)
+            if parsed is None:
+                continue
 
+            if self._is_end_time_node(time_node, article):
+                if end_time is None:
+                    end_time = parsed
+            elif start_time is None:
+                start_time = parsed
+
+        return start_time, end_time
+
+    def _is_end_time_node(self, time_node: Tag, article: Tag) -> bool:
+        """Classify a <time> node by its nearest event-time/end-time ancestor."""
+        for ancestor in time_node.parents:
+            if ancestor is article or not isinstance(ancestor, Tag):
+                break
+            classes = ancestor.get("class")
+            if isinstance(classes, list):
+                if "end-time" in classes:
+                    return True
+                if "event-time" in classes:
+                    return False
+        return False
+
+    def _parse_time_node(self, time_node: Tag) -> Optional[datetime]:
         datetime_attr = time_node.get("datetime") or time_node.get("content")
         if not datetime_attr or not isinstance(datetime_attr, str):
             return None
@@ -226,10 +291,9 @@ class WheeliePopParser(BaseParser):
 
         return raw_title.strip() or None
 
-    def _event_key(self, event: FoodTruckEvent) -> str:
-        start_key = (
-            event.start_time.strftime("%Y-%m-%d %H:%M")
-            if event.start_time is not None
-            else ""
+    def _event_key(self, event: FoodTruckEvent) -> EventKey:
+        return (
+            event.date.date(),
+            event.start_time,
+            event.food_truck_name.lower(),
         )
-        return f"{event.date.strftime('%Y-%m-%d')}|{start_key}|{event.food_truck_name.lower()}"
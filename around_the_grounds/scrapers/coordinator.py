@@ -50,7 +50,14 @@ class ScraperCoordinator:
         """
         self.errors = []  # Reset errors for this run
 
-        connector = aiohttp.TCPConnector(limit=self.max_concurrent)
+        # Keep connections warm and cache DNS so parsers that issue several
+        # requests to the same host reuse sockets instead of re-handshaking
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent,
+            limit_per_host=8,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+        )
         async with aiohttp.ClientSession(
             connector=connector,
             timeout=self.timeout,
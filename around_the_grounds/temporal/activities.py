@@ -1,12 +1,8 @@
 """Activity implementations for Temporal workflows."""
 
 import json
-import os
 import shutil
 import subprocess
-
-# Import functions we need (these are safe to import in activities)
-import sys
 from datetime import datetime
 from pathlib import Path
 from subprocess import CalledProcessError
@@ -14,8 +10,6 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from temporalio import activity
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from around_the_grounds.main import (
     generate_web_data,
     load_brewery_config,
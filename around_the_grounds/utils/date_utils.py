@@ -1,7 +1,23 @@
 import logging
 import re
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+# Month abbreviation lookup, built once at import instead of per parse call
+MONTH_MAP: Dict[str, int] = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
 
 
 class DateUtils:
@@ -63,6 +79,10 @@ class DateUtils:
         Parse time range from text like "1 — 8pm" or "12:30 - 9:00pm".
         Returns (start_hour, end_hour) in 24-hour format.
         """
+        lowered = text.lower()
+        if "am" not in lowered and "pm" not in lowered:
+            return None
+
         # Pattern for time ranges like "1 — 8pm", "12 - 9pm"
         time_pattern = (
             r"(\d{1,2})(?::(\d{2}))?\s*[—\-]\s*(\d{1,2})(?::(\d{2}))?\s*(am|pm)"
@@ -116,22 +136,7 @@ class DateUtils:
         """
         Parse month name and day.
         """
-        month_map = {
-            "jan": 1,
-            "feb": 2,
-            "mar": 3,
-            "apr": 4,
-            "may": 5,
-            "jun": 6,
-            "jul": 7,
-            "aug": 8,
-            "sep": 9,
-            "oct": 10,
-            "nov": 11,
-            "dec": 12,
-        }
-
-        month = month_map.get(month_name.lower()[:3])
+        month = MONTH_MAP.get(month_name.lower()[:3])
         if month:
             return DateUtils._parse_month_day(month, day)
 
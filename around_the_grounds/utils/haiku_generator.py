@@ -4,9 +4,10 @@ import asyncio
 import logging
 import os
 import random
+import string
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import anthropic
 
@@ -17,6 +18,10 @@ DEFAULT_PROMPT_PATH = (
     Path(__file__).resolve().parent.parent / "config" / "haiku_prompt.txt"
 )
 
+# Snapshot the env var once at import so per-instance construction avoids the
+# os.environ lookup. Changing HAIKU_PROMPT_FILE requires a process restart.
+_ENV_PROMPT_PATH = os.environ.get("HAIKU_PROMPT_FILE")
+
 DEFAULT_PROMPT_TEMPLATE = """Today's date is: {date}
 
 Today's featured food truck: {truck_name} at {brewery_name}
@@ -52,6 +57,38 @@ Hops drank with good eats 🍺
 
 Return only the haiku with inline emoji, nothing else."""
 
+# Parsed (literal, field, format_spec, conversion) segments of a prompt
+# template. Compiling once means each _build_prompt call only joins strings
+# instead of re-scanning the ~1KB template for placeholders.
+_CompiledTemplate = List[Tuple[str, Optional[str], str, Optional[str]]]
+
+_TEMPLATE_FIELDS = frozenset({"date", "truck_name", "brewery_name", "events_summary"})
+
+
+def _compile_template(template: str) -> _CompiledTemplate:
+    """Parse a prompt template into literal/placeholder segments.
+
+    Raises KeyError for unknown placeholders and ValueError for malformed
+    templates (e.g. unmatched braces, unknown conversion specifiers, nested
+    format specs), mirroring str.format behavior.
+    """
+    segments: _CompiledTemplate = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        if field is not None:
+            if field not in _TEMPLATE_FIELDS:
+                raise KeyError(field)
+            if conversion is not None and conversion not in ("s", "r", "a"):
+                raise ValueError(f"Unknown conversion specifier {conversion!r}")
+            if format_spec and "{" in format_spec:
+                raise ValueError(
+                    "Nested replacement fields in format specs are not supported"
+                )
+        segments.append((literal, field, format_spec or "", conversion))
+    return segments
+
+
+_COMPILED_DEFAULT_TEMPLATE = _compile_template(DEFAULT_PROMPT_TEMPLATE)
+
 
 class HaikuGenerator:
     """Generates haikus about food truck events using Claude Sonnet 4.5."""
@@ -72,6 +109,7 @@ class HaikuGenerator:
             if prompt_template
             else self._load_prompt_template(prompt_path)
         )
+        self._compiled_template = self._compile_prompt_template(self.prompt_template)
 
     async def generate_haiku(
         self, date: datetime, events: List[FoodTruckEvent], max_retries: int = 2
@@ -79,14 +117,21 @@ class HaikuGenerator:
         """
         Generate a haiku based on today's food truck events.
 
+        Events not falling on the given date are filtered out before the
+        prompt is built, so passing a full multi-day schedule keeps the
+        prompt bounded to today's lineup.
+
         Args:
             date: The date for the haiku context
-            events: List of food truck events for today
+            events: List of food truck events; only events on `date` are used
             max_retries: Maximum number of retry attempts
 
         Returns:
             Haiku string with emojis and 3 lines, or None if generation fails
         """
+        today = date.date()
+        events = [event for event in events if event.date.date() == today]
+
         if not events:
             self.logger.debug("No events provided for haiku generation")
             return None
@@ -146,24 +191,13 @@ class HaikuGenerator:
                 events=[selected_event],
             )
 
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=150,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt,
-                    }
-                ],
-            )
+            # The Anthropic client is synchronous, so run the streaming call
+            # in a worker thread to keep the event loop free while tokens
+            # arrive. (asyncio.to_thread needs Python 3.9; we support 3.8.)
+            loop = asyncio.get_running_loop()
+            buffer = await loop.run_in_executor(None, self._stream_haiku, prompt)
 
-            # Extract the response text
-            content_block = message.content[0]
-            if hasattr(content_block, "text"):
-                response_text = content_block.text.strip()  # type: ignore
-            else:
-                # Handle different content types by converting to string
-                response_text = str(content_block).strip()
+            response_text = buffer.strip()
 
             if response_text:
                 # Clean up the response (remove extra whitespace, ensure 3 lines)
@@ -180,13 +214,59 @@ class HaikuGenerator:
             self.logger.error(f"Claude API error generating haiku: {str(e)}")
             raise  # Re-raise to allow retry logic to handle it
 
+    def _stream_haiku(self, prompt: str) -> str:
+        """Stream a haiku response from the API (blocking; run in a thread).
+
+        Stops as soon as the haiku is complete. Haikus are ~40 tokens, so
+        closing the stream early means the remaining output tokens are never
+        generated (or billed).
+        """
+        buffer = ""
+        haiku_complete = False
+        with self.client.messages.stream(
+            model="claude-sonnet-4-20250514",
+            max_tokens=64,
+            messages=[
+                {
+                    "role": "user",
+                    "content": prompt,
+                }
+            ],
+        ) as stream:
+            for text in stream.text_stream:
+                buffer += text
+                if self._has_complete_haiku(buffer):
+                    haiku_complete = True
+                    break
+
+            if not haiku_complete:
+                # If the stream ran out of tokens before the haiku was
+                # done, treat it as incomplete so the retry logic kicks
+                # in instead of silently truncating.
+                final_message = stream.get_final_message()
+                if getattr(final_message, "stop_reason", None) == "max_tokens":
+                    raise ValueError("Haiku truncated at max_tokens")
+
+        return buffer
+
+    def _has_complete_haiku(self, buffer: str) -> bool:
+        """Check whether the streamed buffer already contains 3 full text lines."""
+        # Only count lines terminated by a newline; the last segment may still
+        # be mid-generation.
+        complete_lines = buffer.split("\n")[:-1]
+        text_lines = [line for line in complete_lines if any(c.isalnum() for c in line)]
+        return len(text_lines) >= 3
+
     def _clean_haiku(self, haiku: str) -> Optional[str]:
         """Clean up haiku text to ensure proper formatting."""
-        # Split by newlines and filter empty lines
-        lines = [line.strip() for line in haiku.split("\n") if line.strip()]
-
-        # Filter out lines that are ONLY emojis/symbols (no alphanumeric content)
-        text_lines = [line for line in lines if any(c.isalnum() for c in line)]
+        # splitlines handles \r\n as well as \n, and the alnum check already
+        # drops empty lines and lines that are ONLY emojis/symbols, so one
+        # pass over the text replaces the previous strip-then-filter passes
+        text_lines = [
+            line.strip()
+            for line in haiku.splitlines()
+            if any(c.isalnum() for c in line)
+        ]
 
         # Haiku must have exactly 3 lines with actual text content
         if len(text_lines) < 3:
@@ -207,9 +287,8 @@ class HaikuGenerator:
         if prompt_path:
             candidate_paths.append(Path(prompt_path))
 
-        env_path = os.getenv("HAIKU_PROMPT_FILE")
-        if env_path:
-            candidate_paths.append(Path(env_path))
+        if _ENV_PROMPT_PATH:
+            candidate_paths.append(Path(_ENV_PROMPT_PATH))
 
         candidate_paths.append(DEFAULT_PROMPT_PATH)
 
@@ -236,43 +315,50 @@ class HaikuGenerator:
         self.logger.debug("Using built-in haiku prompt template fallback")
         return DEFAULT_PROMPT_TEMPLATE
 
-    def _build_prompt(
-        self,
-        *,
-        date_str: str,
-        truck_name: str,
-        brewery_name: str,
-        events: List[FoodTruckEvent],
-    ) -> str:
-        """Render the configured prompt template with context."""
-        events_summary = "\n".join(
-            f"- {event.food_truck_name} at {event.brewery_name}" for event in events
-        )
-
-        template = self.prompt_template
-
+    def _compile_prompt_template(self, template: str) -> _CompiledTemplate:
+        """Compile the configured template once, falling back to the default."""
         try:
-            return template.format(
-                date=date_str,
-                truck_name=truck_name,
-                brewery_name=brewery_name,
-                events_summary=events_summary,
-            )
+            return _compile_template(template)
         except KeyError as exc:
             self.logger.warning(
-                "Prompt template missing placeholder %s; falling back to default",
+                "Prompt template has unknown placeholder %s; falling back to default",
                 exc,
             )
         except ValueError as exc:
             # e.g. unmatched braces
             self.logger.warning(
-                "Prompt template formatting failed (%s); falling back to default",
+                "Prompt template is malformed (%s); falling back to default",
                 exc,
             )
+        return _COMPILED_DEFAULT_TEMPLATE
 
-        return DEFAULT_PROMPT_TEMPLATE.format(
-            date=date_str,
-            truck_name=truck_name,
-            brewery_name=brewery_name,
-            events_summary=events_summary,
-        )
+    def _build_prompt(
+        self,
+        *,
+        date_str: str,
+        truck_name: str,
+        brewery_name: str,
+        events: List[FoodTruckEvent],
+    ) -> str:
+        """Render the precompiled prompt template with context."""
+        context = {
+            "date": date_str,
+            "truck_name": truck_name,
+            "brewery_name": brewery_name,
+            "events_summary": "\n".join(event.summary_line for event in events),
+        }
+
+        parts = []
+        for literal, field, format_spec, conversion in self._compiled_template:
+            parts.append(literal)
+            if field is None:
+                continue
+            value = context[field]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "a":
+                value = ascii(value)
+            if format_spec:
+                value = format(value, format_spec)
+            parts.append(value)
+        return "".join(parts)
@@ -10,6 +10,15 @@ import pytest
 from around_the_grounds.models import Brewery, FoodTruckEvent
 
 
+def fields(obj: Any, *names: str) -> Dict[str, Any]:
+    """Project the named attributes of an object into a dict.
+
+    Lets tests compare several attributes in one dict equality instead of a
+    run of per-attribute asserts, with the full diff shown on mismatch.
+    """
+    return {name: getattr(obj, name) for name in names}
+
+
 @pytest.fixture
 def sample_brewery() -> Brewery:
     """Sample brewery for testing."""
@@ -35,25 +44,25 @@ def sample_food_truck_event() -> FoodTruckEvent:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     """Get the fixtures directory path."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def html_fixtures_dir(fixtures_dir: Path) -> Path:
     """Get the HTML fixtures directory path."""
     return fixtures_dir / "html"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_fixtures_dir(fixtures_dir: Path) -> Path:
     """Get the config fixtures directory path."""
     return fixtures_dir / "config"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def csv_fixtures_dir(fixtures_dir: Path) -> Path:
     """Get the CSV fixtures directory path."""
     return fixtures_dir / "csv"
@@ -12,6 +12,30 @@ from around_the_grounds.models import Brewery, FoodTruckEvent
 from around_the_grounds.scrapers.coordinator import ScraperCoordinator, ScrapingError
 
 
+@pytest.fixture(scope="module")
+def sample_events() -> List[FoodTruckEvent]:
+    """Create sample events once per module; tests only read them."""
+    future_date = datetime.now() + timedelta(days=2)
+    return [
+        FoodTruckEvent(
+            brewery_key="test-brewery-1",
+            brewery_name="Test Brewery 1",
+            food_truck_name="Test Truck 1",
+            date=future_date,
+            start_time=future_date.replace(hour=12),
+            end_time=future_date.replace(hour=20),
+        ),
+        FoodTruckEvent(
+            brewery_key="test-brewery-2",
+            brewery_name="Test Brewery 2",
+            food_truck_name="Test Truck 2",
+            date=future_date,
+            start_time=future_date.replace(hour=13),
+            end_time=future_date.replace(hour=21),
+        ),
+    ]
+
+
 class TestScraperCoordinator:
     """Test the ScraperCoordinator class."""
 
@@ -38,29 +62,6 @@ class TestScraperCoordinator:
             ),
         ]
 
-    @pytest.fixture
-    def sample_events(self) -> List[FoodTruckEvent]:
-        """Create sample events for testing."""
-        future_date = datetime.now() + timedelta(days=2)
-        return [
-            FoodTruckEvent(
-                brewery_key="test-brewery-1",
-                brewery_name="Test Brewery 1",
-                food_truck_name="Test Truck 1",
-                date=future_date,
-                start_time=future_date.replace(hour=12),
-                end_time=future_date.replace(hour=20),
-            ),
-            FoodTruckEvent(
-                brewery_key="test-brewery-2",
-                brewery_name="Test Brewery 2",
-                food_truck_name="Test Truck 2",
-                date=future_date,
-                start_time=future_date.replace(hour=13),
-                end_time=future_date.replace(hour=21),
-            ),
-        ]
-
     @pytest.mark.asyncio
     async def test_scrape_all_success(
         self,
@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from around_the_grounds.main import generate_web_data, _generate_haiku_for_today
 from around_the_grounds.models import FoodTruckEvent
@@ -118,15 +118,15 @@ class TestHaikuIntegration:
         self, mock_anthropic_client: Mock, sample_events_today: list, sample_events_future: list
     ) -> None:
         """Test that _generate_haiku_for_today only uses today's events."""
-        # Mock the API response
-        mock_message = Mock()
-        mock_content = Mock()
-        mock_content.text = "Today's haiku\nWith today's trucks\nNot tomorrow's"
-        mock_message.content = [mock_content]
+        # Mock the streamed API response
+        mock_stream_cm = MagicMock()
+        mock_stream_cm.__enter__.return_value.text_stream = iter(
+            ["Today's haiku\nWith today's trucks\nNot tomorrow's"]
+        )
 
         mock_client_instance = mock_anthropic_client.return_value
-        mock_create = Mock(return_value=mock_message)
-        mock_client_instance.messages.create = mock_create
+        mock_create = Mock(return_value=mock_stream_cm)
+        mock_client_instance.messages.stream = mock_create
 
         # Combine today and future events
         all_events = sample_events_today + sample_events_future
@@ -1,14 +1,15 @@
 """Tests for Chuck's Greenwood parser."""
 
+from datetime import datetime
 from pathlib import Path
 
 import aiohttp
 import pytest
 from aioresponses import aioresponses
-from freezegun import freeze_time
 
 from around_the_grounds.models import Brewery
 from around_the_grounds.parsers.chucks_greenwood import ChucksGreenwoodParser
+from around_the_grounds.utils import timezone_utils
 
 
 class TestChucksGreenwoodParser:
@@ -33,6 +34,15 @@ class TestChucksGreenwoodParser:
         """Create a parser instance."""
         return ChucksGreenwoodParser(brewery)
 
+    @pytest.fixture
+    def pacific_today(self, monkeypatch: pytest.MonkeyPatch):
+        """Pin the parser's Pacific-time clock without freezegun's global patching."""
+
+        def _set(dt: datetime) -> None:
+            monkeypatch.setattr(timezone_utils, "now_in_pacific_naive", lambda: dt)
+
+        return _set
+
     @pytest.fixture
     def sample_csv(self, csv_fixtures_dir: Path) -> str:
         """Load sample CSV fixture."""
@@ -48,11 +58,11 @@ class TestChucksGreenwoodParser:
     # SUCCESS CASES
 
     @pytest.mark.asyncio
-    @freeze_time("2025-08-05")  # Use consistent test date
     async def test_parse_sample_csv_data(
-        self, parser: ChucksGreenwoodParser, sample_csv: str
+        self, parser: ChucksGreenwoodParser, sample_csv: str, pacific_today
     ) -> None:
         """Test parsing the sample CSV data."""
+        pacific_today(datetime(2025, 8, 5))  # Use consistent test date
         with aioresponses() as m:
             m.get(parser.brewery.url, status=200, body=sample_csv)
 
@@ -83,11 +93,11 @@ class TestChucksGreenwoodParser:
                     assert "Bingo" not in event.food_truck_name
 
     @pytest.mark.asyncio
-    @freeze_time("2025-08-05")
     async def test_parse_with_redirect(
-        self, parser: ChucksGreenwoodParser, sample_csv: str
+        self, parser: ChucksGreenwoodParser, sample_csv: str, pacific_today
     ) -> None:
         """Test parsing with Google CDN redirect."""
+        pacific_today(datetime(2025, 8, 5))
         redirect_url = "https://doc-0s-3s-sheets.googleusercontent.com/pub/example/csv"
 
         with aioresponses() as m:
@@ -228,27 +238,33 @@ Another,incomplete"""
 
     # DATE PARSING TESTS
 
-    @freeze_time("2025-08-05")
-    def test_parse_date_current_year(self, parser: ChucksGreenwoodParser) -> None:
+    def test_parse_date_current_year(
+        self, parser: ChucksGreenwoodParser, pacific_today
+    ) -> None:
         """Test date parsing for current year."""
+        pacific_today(datetime(2025, 8, 5))
         result = parser._parse_date_from_month_date_column("Fri", "Aug 15")
         assert result is not None
         assert result.year == 2025
         assert result.month == 8
         assert result.day == 15
 
-    @freeze_time("2025-12-25")
-    def test_parse_date_next_year_rollover(self, parser: ChucksGreenwoodParser) -> None:
+    def test_parse_date_next_year_rollover(
+        self, parser: ChucksGreenwoodParser, pacific_today
+    ) -> None:
         """Test date parsing with year rollover."""
+        pacific_today(datetime(2025, 12, 25))
         result = parser._parse_date_from_month_date_column("Wed", "Jan 15")
         assert result is not None
         assert result.year == 2026  # Should be next year
         assert result.month == 1
         assert result.day == 15
 
-    @freeze_time("2025-08-05")
-    def test_parse_date_same_month(self, parser: ChucksGreenwoodParser) -> None:
+    def test_parse_date_same_month(
+        self, parser: ChucksGreenwoodParser, pacific_today
+    ) -> None:
         """Test date parsing for same month."""
+        pacific_today(datetime(2025, 8, 5))
         result = parser._parse_date_from_month_date_column("Sun", "Aug 10")
         assert result is not None
         assert result.year == 2025
@@ -283,11 +299,11 @@ Another,incomplete"""
 
     # CSV ROW PARSING TESTS
 
-    @freeze_time("2025-08-05")
     def test_parse_csv_row_valid_food_truck(
-        self, parser: ChucksGreenwoodParser
+        self, parser: ChucksGreenwoodParser, pacific_today
     ) -> None:
         """Test parsing a valid food truck CSV row."""
+        pacific_today(datetime(2025, 8, 5))
         row = [
             "Fri",
             "Aug 1",
@@ -427,9 +443,11 @@ Another,incomplete"""
     # INTEGRATION TESTS
 
     @pytest.mark.asyncio
-    @freeze_time("2025-08-05")
-    async def test_parse_mixed_event_types(self, parser: ChucksGreenwoodParser) -> None:
+    async def test_parse_mixed_event_types(
+        self, parser: ChucksGreenwoodParser, pacific_today
+    ) -> None:
         """Test parsing CSV with mixed food truck and non-food truck events."""
+        pacific_today(datetime(2025, 8, 5))
         mixed_csv = """Greenwood Events & Food Trucks,,,,,,,Date Created,Last Updated,All Day Event,Recurring Event
 Fri,Aug 1,12 AM,to,Sat,Food Truck,Dinner: T'Juana,Wed,Tue,FALSE,TRUE
 Sat,Aug 2,12 AM,to,Thu,Event,Trivia Night,Tue,Sat,FALSE,TRUE
@@ -456,11 +474,11 @@ Tue,Aug 5,12 AM,to,Tue,Food Truck,Tat's Deli,Wed,Tue,FALSE,TRUE"""
                     assert "Bingo" not in event.food_truck_name
 
     @pytest.mark.asyncio
-    @freeze_time("2025-12-15")  # Test year rollover scenario
     async def test_parse_year_rollover_dates(
-        self, parser: ChucksGreenwoodParser
+        self, parser: ChucksGreenwoodParser, pacific_today
     ) -> None:
         """Test parsing dates that should be in next year."""
+        pacific_today(datetime(2025, 12, 15))  # Test year rollover scenario
         rollover_csv = """Greenwood Events & Food Trucks,,,,,,,Date Created,Last Updated,All Day Event,Recurring Event
 Mon,Jan 15,12 AM,to,Mon,Food Truck,New Year Vendor,Sat,Mon,FALSE,TRUE
 Tue,Feb 20,12 AM,to,Tue,Food Truck,February Truck,Sun,Tue,FALSE,TRUE"""
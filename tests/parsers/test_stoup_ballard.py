@@ -6,48 +6,59 @@ from pathlib import Path
 import aiohttp
 import pytest
 from aioresponses import aioresponses
-from freezegun import freeze_time
 
 from around_the_grounds.models import Brewery
 from around_the_grounds.parsers.stoup_ballard import StoupBallardParser
+from around_the_grounds.utils import timezone_utils
+
+
+@pytest.fixture(scope="module")
+def brewery() -> Brewery:
+    """Create a test brewery for Stoup Ballard."""
+    return Brewery(
+        key="stoup-ballard",
+        name="Stoup Brewing - Ballard",
+        url="https://example.com/ballard",
+        parser_config={
+            "selectors": {
+                "food_truck_entry": ".food-truck-entry",
+                "date": "h4",
+                "time": "p",
+            }
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def structured_html(html_fixtures_dir: Path) -> str:
+    """Load structured HTML fixture."""
+    fixture_path = html_fixtures_dir / "stoup_structured.html"
+    return fixture_path.read_text()
 
 
 class TestStoupBallardParser:
     """Test the StoupBallardParser class."""
 
-    @pytest.fixture
-    def brewery(self) -> Brewery:
-        """Create a test brewery for Stoup Ballard."""
-        return Brewery(
-            key="stoup-ballard",
-            name="Stoup Brewing - Ballard",
-            url="https://example.com/ballard",
-            parser_config={
-                "selectors": {
-                    "food_truck_entry": ".food-truck-entry",
-                    "date": "h4",
-                    "time": "p",
-                }
-            },
-        )
-
     @pytest.fixture
     def parser(self, brewery: Brewery) -> StoupBallardParser:
         """Create a parser instance."""
         return StoupBallardParser(brewery)
 
     @pytest.fixture
-    def structured_html(self, html_fixtures_dir: Path) -> str:
-        """Load structured HTML fixture."""
-        fixture_path = html_fixtures_dir / "stoup_structured.html"
-        return fixture_path.read_text()
+    def pacific_today(self, monkeypatch: pytest.MonkeyPatch):
+        """Pin the parser's Pacific-time clock without freezegun's global patching."""
+
+        def _set(dt: datetime) -> None:
+            monkeypatch.setattr(timezone_utils, "now_in_pacific_naive", lambda: dt)
+
+        return _set
 
     @pytest.mark.asyncio
-    @freeze_time("2025-07-05")
     async def test_parse_structured_data(
-        self, parser: StoupBallardParser, structured_html: str
+        self, parser: StoupBallardParser, structured_html: str, pacific_today
     ) -> None:
         """Test parsing structured HTML data."""
+        pacific_today(datetime(2025, 7, 5))
         with aioresponses() as m:
             m.get(parser.brewery.url, status=200, body=structured_html)
 
@@ -137,18 +148,22 @@ class TestStoupBallardParser:
                 assert event.start_time is None
                 assert event.end_time is None
 
-    @freeze_time("2025-07-05")
-    def test_parse_date_current_year(self, parser: StoupBallardParser) -> None:
+    def test_parse_date_current_year(
+        self, parser: StoupBallardParser, pacific_today
+    ) -> None:
         """Test date parsing for current year."""
+        pacific_today(datetime(2025, 7, 5))
         result = parser._parse_date("07.05")
         assert result is not None
         assert result.year == 2025
         assert result.month == 7
         assert result.day == 5
 
-    @freeze_time("2025-12-25")
-    def test_parse_date_next_year_rollover(self, parser: StoupBallardParser) -> None:
+    def test_parse_date_next_year_rollover(
+        self, parser: StoupBallardParser, pacific_today
+    ) -> None:
         """Test date parsing with year rollover."""
+        pacific_today(datetime(2025, 12, 25))
         result = parser._parse_date("01.15")
         assert result is not None
         assert result.year == 2026  # Should be next year
@@ -160,7 +175,6 @@ class TestStoupBallardParser:
         result = parser._parse_date("invalid")
         assert result is None
 
-    @freeze_time("2025-07-05")
     def test_parse_time_pm_range(self, parser: StoupBallardParser) -> None:
         """Test parsing PM time range."""
         date = datetime(2025, 7, 5)
@@ -169,7 +183,6 @@ class TestStoupBallardParser:
         assert start_time.hour == 13  # 1pm
         assert end_time.hour == 20  # 8pm
 
-    @freeze_time("2025-07-05")
     def test_parse_time_am_range(self, parser: StoupBallardParser) -> None:
         """Test parsing AM time range."""
         date = datetime(2025, 7, 5)
@@ -188,7 +201,6 @@ class TestStoupBallardParser:
         assert start_time is None
         assert end_time is None
 
-    @freeze_time("2025-07-05")
     def test_parse_time_from_text_valid(self, parser: StoupBallardParser) -> None:
         """Test parsing time from valid text."""
         date = datetime(2025, 7, 5)
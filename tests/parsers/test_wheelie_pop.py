@@ -30,21 +30,22 @@ from around_the_grounds.models import Brewery
 from around_the_grounds.parsers.wheelie_pop import WheeliePopParser
 
 
+@pytest.fixture(scope="module")
+def brewery() -> Brewery:
+    """Create a test brewery for Wheelie Pop."""
+    return Brewery(
+        key="wheelie-pop",
+        name="Wheelie Pop Brewing",
+        url="https://wheeliepopbrewing.com/ballard-brewery-district-draft/",
+        parser_config={
+            "note": "MyCalendar-based calendar system with AJAX requests",
+        },
+    )
+
+
 class TestWheeliePopParser:
     """Test the WheeliePopParser class."""
 
-    @pytest.fixture
-    def brewery(self) -> Brewery:
-        """Create a test brewery for Wheelie Pop."""
-        return Brewery(
-            key="wheelie-pop",
-            name="Wheelie Pop Brewing",
-            url="https://wheeliepopbrewing.com/ballard-brewery-district-draft/",
-            parser_config={
-                "note": "MyCalendar-based calendar system with AJAX requests",
-            },
-        )
-
     @pytest.fixture
     def parser(self, brewery: Brewery) -> WheeliePopParser:
         """Create a parser instance."""
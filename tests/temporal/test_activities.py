@@ -1,20 +1,32 @@
 """Tests for Temporal activities."""
 
+from contextlib import ExitStack
 from datetime import datetime
-from typing import Any, Dict, List
-from unittest.mock import AsyncMock, MagicMock, patch
+from pathlib import Path
+from subprocess import CalledProcessError
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
 
+from around_the_grounds.models import Brewery, FoodTruckEvent
+from around_the_grounds.scrapers.coordinator import (
+    ScraperCoordinator,
+    ScrapingError,
+)
 from around_the_grounds.temporal.activities import (
     DeploymentActivities,
     ScrapeActivities,
 )
+from around_the_grounds.utils.github_auth import GitHubAppAuth
+from tests.conftest import fields
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_brewery_configs() -> List[Dict[str, Any]]:
-    """Fixture providing mock brewery configurations."""
+    """Fixture providing mock brewery configurations, built once per module."""
     return [
         {
             "key": "test-brewery-1",
@@ -31,9 +43,9 @@ def mock_brewery_configs() -> List[Dict[str, Any]]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_events() -> List[Dict[str, Any]]:
-    """Fixture providing mock food truck events."""
+    """Fixture providing mock food truck events, built once per module."""
     return [
         {
             "brewery_key": "test-brewery-1",
@@ -58,6 +70,95 @@ def mock_events() -> List[Dict[str, Any]]:
     ]
 
 
+# Shared scrape results; tests never mutate these, so the two events are
+# constructed once at import instead of inside every test run
+_MOCK_FOOD_TRUCK_EVENTS = (
+    FoodTruckEvent(
+        brewery_key="test-brewery-1",
+        brewery_name="Test Brewery 1",
+        food_truck_name="Test Truck 1",
+        date=datetime(2025, 7, 6),
+        start_time=datetime(2025, 7, 6, 13, 0),
+        end_time=datetime(2025, 7, 6, 20, 0),
+        description="Great food truck",
+        ai_generated_name=False,
+    ),
+    FoodTruckEvent(
+        brewery_key="test-brewery-2",
+        brewery_name="Test Brewery 2",
+        food_truck_name="AI Truck",
+        date=datetime(2025, 7, 7),
+        start_time=None,
+        end_time=None,
+        description=None,
+        ai_generated_name=True,
+    ),
+)
+
+
+def git_run_dispatch(overrides: Dict[Tuple[str, str], Any]) -> Callable[..., Any]:
+    """Build a subprocess.run side_effect that dispatches on the git subcommand.
+
+    Each call is keyed by ``tuple(cmd[:2])`` (e.g. ``("git", "push")``) and
+    looked up in ``overrides``: exception values are raised, other values are
+    returned, and commands without an entry get a successful result. An O(1)
+    dict lookup replaces the joined-string substring matching the deploy tests
+    used to copy-paste.
+    """
+
+    def run(cmd: List[str], *args: Any, **kwargs: Any) -> Any:
+        result = overrides.get(tuple(cmd[:2]))
+        if isinstance(result, BaseException):
+            raise result
+        if result is not None:
+            return result
+        return MagicMock(returncode=0)
+
+    return run
+
+
+@pytest.fixture
+def deploy_mocks(fs: FakeFilesystem) -> Iterator[SimpleNamespace]:
+    """Give the deploy_to_git tests a fake filesystem plus mocked externals.
+
+    pyfakefs serves the real Path/open/json.dump/shutil.copytree calls from
+    an in-memory filesystem, so only the two true externals — subprocess and
+    GitHub App auth — still need mocks. Tests override behavior by assigning
+    to the yielded mocks, e.g. ``deploy_mocks.subprocess.run.side_effect``.
+    """
+    # deploy_to_git copies this template tree into the cloned repository
+    fs.create_file(
+        Path.cwd() / "public_template" / "index.html", contents="<html></html>"
+    )
+
+    with ExitStack() as stack:
+        subprocess_mock = stack.enter_context(
+            patch("around_the_grounds.temporal.activities.subprocess")
+        )
+        auth_class = stack.enter_context(
+            patch("around_the_grounds.utils.github_auth.GitHubAppAuth")
+        )
+
+        # Mock GitHub App authentication; spec keeps attribute access on
+        # the fast path and catches typos against the real interface
+        auth = Mock(spec=GitHubAppAuth)
+        auth_class.return_value = auth
+        auth.get_access_token.return_value = "test_token"
+        auth.repo_owner = "test"
+        auth.repo_name = "test-repo"
+
+        # Git operations succeed unless a test overrides run.side_effect
+        subprocess_mock.run.return_value.returncode = 0
+        subprocess_mock.CalledProcessError = CalledProcessError
+
+        yield SimpleNamespace(
+            fs=fs,
+            subprocess=subprocess_mock,
+            auth_class=auth_class,
+            auth=auth,
+        )
+
+
 class TestScrapeActivities:
     """Tests for ScrapeActivities."""
 
@@ -69,9 +170,6 @@ class TestScrapeActivities:
         with patch(
             "around_the_grounds.temporal.activities.load_brewery_config"
         ) as mock_load:
-            # Mock breweries
-            from around_the_grounds.models import Brewery
-
             mock_breweries = [
                 Brewery(
                     key="stoup-ballard",
@@ -136,66 +234,44 @@ class TestScrapeActivities:
             "around_the_grounds.temporal.activities.ScraperCoordinator"
         ) as mock_coordinator_class:
             # Mock coordinator instance
-            mock_coordinator = AsyncMock()
+            mock_coordinator = AsyncMock(spec=ScraperCoordinator)
             mock_coordinator_class.return_value = mock_coordinator
 
-            # Mock food truck events
-            from around_the_grounds.models import FoodTruckEvent
-
-            mock_food_truck_events = [
-                FoodTruckEvent(
-                    brewery_key="test-brewery-1",
-                    brewery_name="Test Brewery 1",
-                    food_truck_name="Test Truck 1",
-                    date=datetime(2025, 7, 6),
-                    start_time=datetime(2025, 7, 6, 13, 0),
-                    end_time=datetime(2025, 7, 6, 20, 0),
-                    description="Great food truck",
-                    ai_generated_name=False,
-                ),
-                FoodTruckEvent(
-                    brewery_key="test-brewery-2",
-                    brewery_name="Test Brewery 2",
-                    food_truck_name="AI Truck",
-                    date=datetime(2025, 7, 7),
-                    start_time=None,
-                    end_time=None,
-                    description=None,
-                    ai_generated_name=True,
-                ),
-            ]
-
-            mock_coordinator.scrape_all = AsyncMock(return_value=mock_food_truck_events)
+            mock_coordinator.scrape_all = AsyncMock(
+                return_value=list(_MOCK_FOOD_TRUCK_EVENTS)
+            )
             mock_coordinator.get_errors = MagicMock(return_value=[])
 
             events, errors = await activities.scrape_food_trucks(mock_brewery_configs)
 
             assert isinstance(events, list)
             assert isinstance(errors, list)
-            assert len(events) == 2
-            assert len(errors) == 0
-
-            # Check first event serialization
-            event1 = events[0]
-            assert event1["brewery_key"] == "test-brewery-1"
-            assert event1["brewery_name"] == "Test Brewery 1"
-            assert event1["food_truck_name"] == "Test Truck 1"
-            assert event1["date"] == "2025-07-06T00:00:00"
-            assert event1["start_time"] == "2025-07-06T13:00:00"
-            assert event1["end_time"] == "2025-07-06T20:00:00"
-            assert event1["description"] == "Great food truck"
-            assert event1["ai_generated_name"] is False
-
-            # Check second event serialization
-            event2 = events[1]
-            assert event2["brewery_key"] == "test-brewery-2"
-            assert event2["brewery_name"] == "Test Brewery 2"
-            assert event2["food_truck_name"] == "AI Truck"
-            assert event2["date"] == "2025-07-07T00:00:00"
-            assert event2["start_time"] is None
-            assert event2["end_time"] is None
-            assert event2["description"] is None
-            assert event2["ai_generated_name"] is True
+            assert errors == []
+
+            # Compare the whole serialized payload at once; a mismatch shows
+            # the full diff instead of stopping at the first failed field
+            assert events == [
+                {
+                    "brewery_key": "test-brewery-1",
+                    "brewery_name": "Test Brewery 1",
+                    "food_truck_name": "Test Truck 1",
+                    "date": "2025-07-06T00:00:00",
+                    "start_time": "2025-07-06T13:00:00",
+                    "end_time": "2025-07-06T20:00:00",
+                    "description": "Great food truck",
+                    "ai_generated_name": False,
+                },
+                {
+                    "brewery_key": "test-brewery-2",
+                    "brewery_name": "Test Brewery 2",
+                    "food_truck_name": "AI Truck",
+                    "date": "2025-07-07T00:00:00",
+                    "start_time": None,
+                    "end_time": None,
+                    "description": None,
+                    "ai_generated_name": True,
+                },
+            ]
 
     @pytest.mark.asyncio
     async def test_scrape_food_trucks_with_errors(
@@ -208,13 +284,9 @@ class TestScrapeActivities:
             "around_the_grounds.temporal.activities.ScraperCoordinator"
         ) as mock_coordinator_class:
             # Mock coordinator instance
-            mock_coordinator = AsyncMock()
+            mock_coordinator = AsyncMock(spec=ScraperCoordinator)
             mock_coordinator_class.return_value = mock_coordinator
 
-            # Mock scraping error
-            from around_the_grounds.models import Brewery
-            from around_the_grounds.scrapers.coordinator import ScrapingError
-
             mock_error_brewery = Brewery(
                 key="test-brewery-1",
                 name="Test Brewery 1",
@@ -257,11 +329,9 @@ class TestScrapeActivities:
         with patch(
             "around_the_grounds.temporal.activities.ScraperCoordinator"
         ) as mock_coordinator_class:
-            mock_coordinator = AsyncMock()
+            mock_coordinator = AsyncMock(spec=ScraperCoordinator)
             mock_coordinator_class.return_value = mock_coordinator
 
-            from around_the_grounds.models import FoodTruckEvent
-
             mock_event = FoodTruckEvent(
                 brewery_key="test-brewery-1",
                 brewery_name="Test Brewery 1",
@@ -295,12 +365,9 @@ class TestScrapeActivities:
         with patch(
             "around_the_grounds.temporal.activities.ScraperCoordinator"
         ) as mock_coordinator_class:
-            mock_coordinator = AsyncMock()
+            mock_coordinator = AsyncMock(spec=ScraperCoordinator)
             mock_coordinator_class.return_value = mock_coordinator
 
-            from around_the_grounds.models import Brewery
-            from around_the_grounds.scrapers.coordinator import ScrapingError
-
             error_brewery = Brewery(
                 key="test-brewery-1",
                 name="Test Brewery 1",
@@ -391,266 +458,100 @@ class TestDeploymentActivities:
                 "Failed to fetch information for brewery: Test Brewery 1"
             ]
 
-            # Check first reconstructed event
-            event1 = reconstructed_events[0]
-            assert event1.brewery_key == "test-brewery-1"
-            assert event1.brewery_name == "Test Brewery 1"
-            assert event1.food_truck_name == "Test Truck 1"
-            assert event1.ai_generated_name is False
-
-            # Check second reconstructed event
-            event2 = reconstructed_events[1]
-            assert event2.brewery_key == "test-brewery-1"
-            assert event2.brewery_name == "Test Brewery 1"
-            assert event2.food_truck_name == "AI Truck"
-            assert event2.ai_generated_name is True
-
-    @pytest.mark.asyncio
-    async def test_deploy_to_git_success(self) -> None:
-        """Test successful git deployment."""
-        activities = DeploymentActivities()
-
-        mock_web_data = {
-            "events": [
-                {
-                    "date": "2025-07-06T00:00:00",
-                    "vendor": "Test Truck",
-                    "location": "Test Brewery",
-                    "start_time": "01:00 PM",
-                    "end_time": "08:00 PM",
-                    "description": "Great food truck",
-                }
-            ],
-            "total_events": 1,
-            "updated": "2025-07-06T00:00:00",
-        }
-
-        with patch("around_the_grounds.temporal.activities.Path") as _mock_path, patch(
-            "around_the_grounds.temporal.activities.json"
-        ) as _mock_json, patch(
-            "around_the_grounds.temporal.activities.subprocess"
-        ) as mock_subprocess, patch(
-            "around_the_grounds.utils.github_auth.GitHubAppAuth"
-        ) as _mock_auth_class, patch(
-            "tempfile.TemporaryDirectory"
-        ) as mock_tempdir, patch("builtins.open", create=True) as _mock_open, patch(
-            "around_the_grounds.temporal.activities.shutil.copytree"
-        ) as _mock_copytree:
-            # Mock temporary directory
-            mock_tempdir.return_value.__enter__.return_value = "/tmp/test"
-            mock_tempdir.return_value.__exit__.return_value = None
-
-            # Mock Path operations
-            mock_repo_dir = MagicMock()
-            mock_repo_dir.configure_mock(**{"__str__.return_value": "/tmp/test/repo"})
-            mock_repo_dir.__truediv__.return_value = MagicMock()
-            mock_repo_dir.__truediv__.return_value.configure_mock(
-                **{"__str__.return_value": "/tmp/test/repo/public"}
-            )
-
-            # Mock Path.cwd() to return a proper path
-            mock_cwd = MagicMock()
-            mock_cwd.configure_mock(**{"__str__.return_value": "/current/dir"})
-            mock_cwd.__truediv__.return_value = MagicMock()
-            mock_cwd.__truediv__.return_value.configure_mock(
-                **{"__str__.return_value": "/current/dir/public_template"}
-            )
-            _mock_path.cwd.return_value = mock_cwd
-
-            # Mock Path constructor
-            _mock_path.side_effect = lambda x: (
-                mock_repo_dir if str(x).endswith("repo") else MagicMock()
+            # Check reconstructed events, one dict comparison per event
+            event_fields = (
+                "brewery_key",
+                "brewery_name",
+                "food_truck_name",
+                "ai_generated_name",
             )
-
-            # Mock file operations
-            mock_file = MagicMock()
-            _mock_open.return_value.__enter__.return_value = mock_file
-
-            # Mock GitHub App authentication
-            mock_auth = MagicMock()
-            _mock_auth_class.return_value = mock_auth
-            mock_auth.get_access_token.return_value = "test_token"
-            mock_auth.repo_owner = "test"
-            mock_auth.repo_name = "test-repo"
-
-            # Mock git operations
-            mock_subprocess.run.return_value.returncode = 0
-
-            params = {
-                "web_data": mock_web_data,
-                "repository_url": "https://github.com/test/repo.git",
+            assert fields(reconstructed_events[0], *event_fields) == {
+                "brewery_key": "test-brewery-1",
+                "brewery_name": "Test Brewery 1",
+                "food_truck_name": "Test Truck 1",
+                "ai_generated_name": False,
+            }
+            assert fields(reconstructed_events[1], *event_fields) == {
+                "brewery_key": "test-brewery-1",
+                "brewery_name": "Test Brewery 1",
+                "food_truck_name": "AI Truck",
+                "ai_generated_name": True,
             }
-            result = await activities.deploy_to_git(params)  # type: ignore
-
-            assert result is True
 
-            # Just verify the function completes successfully with new signature
-            # (The implementation changed significantly, so we mainly test it doesn't crash)
+    DEPLOY_WEB_DATA = {
+        "events": [
+            {
+                "date": "2025-07-06T00:00:00",
+                "vendor": "Test Truck",
+                "location": "Test Brewery",
+                "start_time": "01:00 PM",
+                "end_time": "08:00 PM",
+                "description": "Great food truck",
+            }
+        ],
+        "total_events": 1,
+        "updated": "2025-07-06T00:00:00",
+    }
 
     @pytest.mark.asyncio
-    async def test_deploy_to_git_git_clone_failure(self) -> None:
-        """Test git deployment when git clone fails."""
-        activities = DeploymentActivities()
-
-        mock_web_data = {
-            "events": [],
-            "total_events": 0,
-            "updated": "2025-07-06T00:00:00",
-        }
-
-        with patch("around_the_grounds.temporal.activities.Path") as _mock_path, patch(
-            "around_the_grounds.temporal.activities.json"
-        ) as _mock_json, patch(
-            "around_the_grounds.temporal.activities.subprocess"
-        ) as mock_subprocess, patch(
-            "around_the_grounds.utils.github_auth.GitHubAppAuth"
-        ) as _mock_auth_class, patch(
-            "tempfile.TemporaryDirectory"
-        ) as mock_tempdir, patch("builtins.open", create=True) as _mock_open:
-            # Mock temporary directory
-            mock_tempdir.return_value.__enter__.return_value = "/tmp/test"
-
-            # Mock git clone failure
-            from subprocess import CalledProcessError
-
-            mock_subprocess.run.side_effect = CalledProcessError(1, "git clone")
-            mock_subprocess.CalledProcessError = CalledProcessError
-
-            with pytest.raises(ValueError, match="Failed to deploy to git"):
-                params = {
-                    "web_data": mock_web_data,
-                    "repository_url": "https://github.com/test/repo.git",
-                }
-                await activities.deploy_to_git(params)  # type: ignore
+    @pytest.mark.integration
+    @pytest.mark.parametrize(
+        ("git_overrides", "expect_error"),
+        [
+            # Default dispatch: every git command succeeds and the staged
+            # diff reports nothing to commit, so deployment exits early
+            pytest.param({}, False, id="success-no-op"),
+            pytest.param(
+                {("git", "diff"): MagicMock(returncode=1)},  # has changes
+                False,
+                id="success-commit-and-push",
+            ),
+            pytest.param(
+                {("git", "diff"): MagicMock(returncode=0)},  # nothing staged
+                False,
+                id="no-changes",
+            ),
+            pytest.param(
+                {("git", "clone"): CalledProcessError(1, "git clone")},
+                True,
+                id="clone-failure",
+            ),
+            pytest.param(
+                {
+                    ("git", "diff"): MagicMock(returncode=1),  # has changes
+                    ("git", "push"): CalledProcessError(
+                        1, ["git", "push"], "Push failed"
+                    ),
+                },
+                True,
+                id="push-failure",
+            ),
+        ],
+    )
+    async def test_deploy_to_git(
+        self,
+        deploy_mocks: SimpleNamespace,
+        git_overrides: Dict[Tuple[str, str], Any],
+        expect_error: bool,
+    ) -> None:
+        """Deployment outcome is decided by how the git subcommands behave.
 
-    @pytest.mark.asyncio
-    async def test_deploy_to_git_no_changes(self) -> None:
-        """Test git deployment when there are no changes to commit."""
+        The scenarios share all their mock setup via deploy_mocks and differ
+        only in the git dispatch table, so they run as one parametrized test
+        instead of four near-duplicate test bodies.
+        """
         activities = DeploymentActivities()
 
-        mock_web_data = {
-            "events": [],
-            "total_events": 0,
-            "updated": "2025-07-06T00:00:00",
-        }
-
-        with patch("around_the_grounds.temporal.activities.Path") as _mock_path, patch(
-            "around_the_grounds.temporal.activities.json"
-        ) as _mock_json, patch(
-            "around_the_grounds.temporal.activities.subprocess"
-        ) as mock_subprocess, patch(
-            "around_the_grounds.utils.github_auth.GitHubAppAuth"
-        ) as _mock_auth_class, patch(
-            "tempfile.TemporaryDirectory"
-        ) as mock_tempdir, patch("builtins.open", create=True) as _mock_open, patch(
-            "around_the_grounds.temporal.activities.shutil.copytree"
-        ) as _mock_copytree:
-            # Mock temporary directory
-            mock_tempdir.return_value.__enter__.return_value = "/tmp/test"
-            mock_tempdir.return_value.__exit__.return_value = None
-
-            # Mock Path operations
-            mock_repo_dir = MagicMock()
-            mock_repo_dir.configure_mock(**{"__str__.return_value": "/tmp/test/repo"})
-            mock_repo_dir.__truediv__.return_value = MagicMock()
-            mock_repo_dir.__truediv__.return_value.configure_mock(
-                **{"__str__.return_value": "/tmp/test/repo/public"}
-            )
-
-            # Mock Path.cwd() to return a proper path
-            mock_cwd = MagicMock()
-            mock_cwd.configure_mock(**{"__str__.return_value": "/current/dir"})
-            mock_cwd.__truediv__.return_value = MagicMock()
-            mock_cwd.__truediv__.return_value.configure_mock(
-                **{"__str__.return_value": "/current/dir/public_template"}
-            )
-            _mock_path.cwd.return_value = mock_cwd
-
-            # Mock Path constructor
-            _mock_path.side_effect = lambda x: (
-                mock_repo_dir if str(x).endswith("repo") else MagicMock()
-            )
-
-            # Mock git operations - simulate no changes
-            def mock_run(cmd: List[str], _cwd: Any = None, **_kwargs: Any) -> Any:
-                if "git diff --staged --quiet" in " ".join(cmd):
-                    return MagicMock(returncode=0)  # no changes to commit
-                else:
-                    return MagicMock(returncode=0)
-
-            mock_subprocess.run.side_effect = mock_run
-
-            # Mock authentication
-            mock_auth = MagicMock()
-            _mock_auth_class.return_value = mock_auth
-            mock_auth.get_access_token.return_value = "test_token"
-            mock_auth.repo_owner = "test"
-            mock_auth.repo_name = "test-repo"
-
-            params = {
-                "web_data": mock_web_data,
-                "repository_url": "https://github.com/test/repo.git",
-            }
-            result = await activities.deploy_to_git(params)  # type: ignore
+        deploy_mocks.subprocess.run.side_effect = git_run_dispatch(git_overrides)
 
-            assert result is True  # Still successful, just no changes
-
-    @pytest.mark.asyncio
-    async def test_deploy_to_git_push_failure(self) -> None:
-        """Test git deployment with push failure but successful commit."""
-        activities = DeploymentActivities()
-
-        mock_web_data = {
-            "events": [
-                {
-                    "date": "2025-07-06T00:00:00",
-                    "vendor": "Test Truck",
-                    "location": "Test Brewery",
-                    "start_time": "01:00 PM",
-                    "end_time": "08:00 PM",
-                    "description": "Great food truck",
-                }
-            ],
-            "total_events": 1,
-            "updated": "2025-07-06T00:00:00",
+        params = {
+            "web_data": self.DEPLOY_WEB_DATA,
+            "repository_url": "https://github.com/test/repo.git",
         }
 
-        with patch("around_the_grounds.temporal.activities.Path") as _mock_path, patch(
-            "around_the_grounds.temporal.activities.json"
-        ) as _mock_json, patch(
-            "around_the_grounds.temporal.activities.subprocess"
-        ) as mock_subprocess, patch(
-            "around_the_grounds.utils.github_auth.GitHubAppAuth"
-        ) as _mock_auth_class, patch(
-            "tempfile.TemporaryDirectory"
-        ) as mock_tempdir, patch("builtins.open", create=True) as _mock_open:
-            # Mock temporary directory
-            mock_tempdir.return_value.__enter__.return_value = "/tmp/test"
-
-            # Mock authentication
-            mock_auth = MagicMock()
-            _mock_auth_class.return_value = mock_auth
-            mock_auth.get_access_token.return_value = "test_token"
-            mock_auth.repo_owner = "test"
-            mock_auth.repo_name = "test-repo"
-
-            # Mock git operations - simulate push failure
-            from subprocess import CalledProcessError
-
-            def mock_run(cmd: List[str], _cwd: Any = None, **_kwargs: Any) -> Any:
-                if "git push" in " ".join(cmd):
-                    raise CalledProcessError(1, cmd, "Push failed")
-                elif "git diff --quiet" in " ".join(cmd):
-                    return MagicMock(returncode=1)  # has changes
-                else:
-                    return MagicMock(returncode=0)
-
-            mock_subprocess.run.side_effect = mock_run
-            mock_subprocess.CalledProcessError = CalledProcessError
-
+        if expect_error:
             with pytest.raises(ValueError, match="Failed to deploy to git"):
-                params = {
-                    "web_data": mock_web_data,
-                    "repository_url": "https://github.com/test/repo.git",
-                }
                 await activities.deploy_to_git(params)  # type: ignore
+        else:
+            result = await activities.deploy_to_git(params)  # type: ignore
+            assert result is True
@@ -1,16 +1,25 @@
 """Unit tests for haiku generator."""
 
+import anthropic
 import pytest
 from datetime import datetime
-from unittest.mock import AsyncMock, Mock, patch
+from typing import Iterator
+from unittest.mock import AsyncMock, MagicMock, Mock
 
 from around_the_grounds.models import FoodTruckEvent
 from around_the_grounds.utils.haiku_generator import HaikuGenerator
 
 
-@pytest.fixture
+def make_mock_stream(response_text: str) -> MagicMock:
+    """Create a mock messages.stream context manager yielding the given text."""
+    stream = MagicMock()
+    stream.__enter__.return_value.text_stream = iter([response_text])
+    return stream
+
+
+@pytest.fixture(scope="module")
 def sample_events() -> list:
-    """Create sample food truck events for testing."""
+    """Create sample food truck events once for the module; tests only read them."""
     return [
         FoodTruckEvent(
             brewery_key="stoup-ballard",
@@ -31,30 +40,56 @@ def sample_events() -> list:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def timeout_error() -> anthropic.APITimeoutError:
+    """Build the APITimeoutError (and its httpx.Request) once per module."""
+    # httpx stays a lazily imported, indirect dependency (via the anthropic
+    # SDK); only timeout tests touch it
+    import httpx
+
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    return anthropic.APITimeoutError(request)
+
+
+@pytest.fixture(autouse=True, scope="class")
+def _patch_anthropic() -> Iterator[Mock]:
+    """Patch the anthropic SDK once per class instead of once per test."""
+    fake_anthropic = Mock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "around_the_grounds.utils.haiku_generator.anthropic.Anthropic",
+            fake_anthropic,
+        )
+        yield fake_anthropic
+
+
+@pytest.fixture(scope="module")
 def haiku_generator() -> HaikuGenerator:
-    """Create HaikuGenerator instance for testing."""
+    """Create one HaikuGenerator for the module; its client is reset per test."""
     return HaikuGenerator(api_key="test-key")
 
 
+@pytest.fixture(autouse=True)
+def mock_client(haiku_generator: HaikuGenerator) -> Mock:
+    """Give the shared generator a fresh mock client before each test."""
+    haiku_generator.client = Mock()
+    return haiku_generator.client
+
+
 class TestHaikuGenerator:
     """Test haiku generation functionality."""
 
     @pytest.mark.asyncio
-    @patch("around_the_grounds.utils.haiku_generator.anthropic.Anthropic")
     async def test_generate_haiku_success(
-        self, mock_anthropic_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
+        self, mock_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
     ) -> None:
         """Test successful haiku generation."""
-        # Mock the API response
-        mock_message = Mock()
-        mock_content = Mock()
-        mock_content.text = "🍂 Autumn breeze whispers\n🍂\nGeorgia's at Stoup awaits\n🍂\nBrews and warmth unite"
-        mock_message.content = [mock_content]
-
-        mock_client_instance = mock_anthropic_client.return_value
-        mock_client_instance.messages.create = Mock(return_value=mock_message)
-        haiku_generator.client = mock_client_instance
+        # Mock the streamed API response
+        mock_client.messages.stream = Mock(
+            return_value=make_mock_stream(
+                "🍂 Autumn breeze whispers\n🍂\nGeorgia's at Stoup awaits\n🍂\nBrews and warmth unite"
+            )
+        )
 
         # Generate haiku
         today = datetime(2025, 10, 13)
@@ -66,9 +101,8 @@ class TestHaikuGenerator:
         assert "\n" in haiku  # Should have multiple lines
 
     @pytest.mark.asyncio
-    @patch("around_the_grounds.utils.haiku_generator.anthropic.Anthropic")
     async def test_generate_haiku_no_events(
-        self, mock_anthropic_client: Mock, haiku_generator: HaikuGenerator
+        self, haiku_generator: HaikuGenerator
     ) -> None:
         """Test haiku generation with no events."""
         today = datetime(2025, 10, 13)
@@ -77,22 +111,16 @@ class TestHaikuGenerator:
         assert haiku is None
 
     @pytest.mark.asyncio
-    @patch("around_the_grounds.utils.haiku_generator.anthropic.Anthropic")
     async def test_generate_haiku_api_timeout(
-        self, mock_anthropic_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
+        self,
+        mock_client: Mock,
+        haiku_generator: HaikuGenerator,
+        sample_events: list,
+        timeout_error: anthropic.APITimeoutError,
     ) -> None:
         """Test haiku generation with API timeout."""
-        import anthropic
-        import httpx
-
         # Mock API timeout error
-        mock_client_instance = mock_anthropic_client.return_value
-        # Create a mock request for the timeout error
-        mock_request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
-        mock_client_instance.messages.create = Mock(
-            side_effect=anthropic.APITimeoutError(mock_request)
-        )
-        haiku_generator.client = mock_client_instance
+        mock_client.messages.stream = Mock(side_effect=timeout_error)
 
         # Generate haiku with max_retries=0 for faster test
         today = datetime(2025, 10, 13)
@@ -101,17 +129,12 @@ class TestHaikuGenerator:
         assert haiku is None
 
     @pytest.mark.asyncio
-    @patch("around_the_grounds.utils.haiku_generator.anthropic.Anthropic")
     async def test_generate_haiku_api_error(
-        self, mock_anthropic_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
+        self, mock_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
     ) -> None:
         """Test haiku generation with API error."""
         # Mock API error (generic exception)
-        mock_client_instance = mock_anthropic_client.return_value
-        mock_client_instance.messages.create = Mock(
-            side_effect=Exception("API Error")
-        )
-        haiku_generator.client = mock_client_instance
+        mock_client.messages.stream = Mock(side_effect=Exception("API Error"))
 
         # Generate haiku
         today = datetime(2025, 10, 13)
@@ -120,22 +143,19 @@ class TestHaikuGenerator:
         assert haiku is None
 
     @pytest.mark.asyncio
-    @patch("around_the_grounds.utils.haiku_generator.anthropic.Anthropic")
     async def test_generate_haiku_with_retry(
-        self, mock_anthropic_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
+        self, mock_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
     ) -> None:
         """Test haiku generation with retry on generic error."""
         # Mock error on first attempt, success on second
-        mock_message = Mock()
-        mock_content = Mock()
-        mock_content.text = "🌧️ Rain falls softly down\nMomoExpress awaits us\nWarmth in every bite"
-        mock_message.content = [mock_content]
-
-        mock_client_instance = mock_anthropic_client.return_value
-        mock_client_instance.messages.create = Mock(
-            side_effect=[Exception("Network Error"), mock_message]
+        mock_client.messages.stream = Mock(
+            side_effect=[
+                Exception("Network Error"),
+                make_mock_stream(
+                    "🌧️ Rain falls softly down\nMomoExpress awaits us\nWarmth in every bite"
+                ),
+            ]
         )
-        haiku_generator.client = mock_client_instance
 
         # Generate haiku
         today = datetime(2025, 10, 13)
@@ -145,6 +165,54 @@ class TestHaikuGenerator:
         assert haiku is not None
         assert "Rain" in haiku or "MomoExpress" in haiku or "Warmth" in haiku
 
+    @pytest.mark.asyncio
+    async def test_generate_haiku_stops_stream_early(
+        self, mock_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
+    ) -> None:
+        """Test that streaming stops once 3 complete text lines have arrived."""
+        # Chunks beyond the completed haiku should never be consumed
+        chunks = iter(
+            ["Line 1\n", "Line 2\n", "Line 3\n", "Extra line that should not be read"]
+        )
+        stream = MagicMock()
+        stream.__enter__.return_value.text_stream = chunks
+
+        mock_client.messages.stream = Mock(return_value=stream)
+
+        today = datetime(2025, 10, 13)
+        haiku = await haiku_generator.generate_haiku(today, sample_events)
+
+        assert haiku == "Line 1\nLine 2\nLine 3"
+        # The extra chunk was left unread because the stream was closed early
+        assert next(chunks) == "Extra line that should not be read"
+
+    @pytest.mark.asyncio
+    async def test_generate_haiku_retries_on_max_tokens_truncation(
+        self, mock_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
+    ) -> None:
+        """Test that a haiku truncated at max_tokens triggers a retry."""
+        # First attempt is cut off mid-haiku by the token cap
+        truncated = MagicMock()
+        truncated.__enter__.return_value.text_stream = iter(["Line 1\nLine 2\nLine"])
+        truncated.__enter__.return_value.get_final_message.return_value.stop_reason = (
+            "max_tokens"
+        )
+
+        mock_client.messages.stream = Mock(
+            side_effect=[
+                truncated,
+                make_mock_stream("Line 1\nLine 2\nLine 3"),
+            ]
+        )
+
+        today = datetime(2025, 10, 13)
+        haiku = await haiku_generator.generate_haiku(
+            today, sample_events, max_retries=1
+        )
+
+        assert haiku == "Line 1\nLine 2\nLine 3"
+        assert mock_client.messages.stream.call_count == 2
+
     def test_clean_haiku(self, haiku_generator: HaikuGenerator) -> None:
         """Test haiku cleaning functionality."""
         # Test with proper 3-line haiku
@@ -162,33 +230,38 @@ class TestHaikuGenerator:
         cleaned = haiku_generator._clean_haiku(haiku)
         assert cleaned == "Line 1\nLine 2\nLine 3"
 
+        # Test with Windows-style line endings
+        haiku = "Line 1\r\nLine 2\r\nLine 3"
+        cleaned = haiku_generator._clean_haiku(haiku)
+        assert cleaned == "Line 1\nLine 2\nLine 3"
+
     @pytest.mark.asyncio
-    @patch("around_the_grounds.utils.haiku_generator.anthropic.Anthropic")
-    @patch("around_the_grounds.utils.haiku_generator.random.choice")
     async def test_generate_haiku_includes_truck_and_brewery(
-        self, mock_random_choice: Mock, mock_anthropic_client: Mock, haiku_generator: HaikuGenerator, sample_events: list
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_client: Mock,
+        haiku_generator: HaikuGenerator,
+        sample_events: list,
     ) -> None:
         """Test that haiku generation prompt includes truck names and breweries."""
         # Mock random.choice to always select first event for deterministic testing
-        mock_random_choice.return_value = sample_events[0]
-
-        # Mock the API response
-        mock_message = Mock()
-        mock_content = Mock()
-        mock_content.text = "Test haiku\nLine two\nLine three"
-        mock_message.content = [mock_content]
+        monkeypatch.setattr(
+            "around_the_grounds.utils.haiku_generator.random.choice",
+            Mock(return_value=sample_events[0]),
+        )
 
-        mock_client_instance = mock_anthropic_client.return_value
-        mock_create = Mock(return_value=mock_message)
-        mock_client_instance.messages.create = mock_create
-        haiku_generator.client = mock_client_instance
+        # Mock the streamed API response
+        mock_stream = Mock(
+            return_value=make_mock_stream("Test haiku\nLine two\nLine three")
+        )
+        mock_client.messages.stream = mock_stream
 
         # Generate haiku
         today = datetime(2025, 10, 13)
         await haiku_generator.generate_haiku(today, sample_events)
 
         # Verify the prompt included the selected truck and brewery
-        call_args = mock_create.call_args
+        call_args = mock_stream.call_args
         prompt = call_args.kwargs["messages"][0]["content"]
 
         # Since we mocked random.choice to return first event, verify that truck appears
@@ -108,3 +108,16 @@ class TestFoodTruckEvent:
         str_repr = str(event)
         assert "Test Truck" in str_repr
         assert "Test Brewery" in str_repr
+
+    def test_food_truck_event_summary_line(self) -> None:
+        """Test the cached prompt summary line."""
+        event = FoodTruckEvent(
+            brewery_key="test-brewery",
+            brewery_name="Test Brewery",
+            food_truck_name="Test Truck",
+            date=datetime(2025, 7, 5, 12, 0, 0),
+        )
+
+        assert event.summary_line == "- Test Truck at Test Brewery"
+        # Cached after first access, so repeated reads return the same object
+        assert event.summary_line is event.summary_line